@@ -3,7 +3,7 @@ import express from 'express';
 import { neon } from '@neondatabase/serverless';
 import { drizzle } from 'drizzle-orm/neon-http';
 import { pgTable, text, serial, integer, boolean, date, timestamp } from 'drizzle-orm/pg-core';
-import { eq, desc } from 'drizzle-orm';
+import { eq, desc, inArray, and, or } from 'drizzle-orm';
 
 // Inline schema definitions (Vercel can't resolve imports from outside /api)
 // Simplified celestial objects - static catalog without time-specific info
@@ -207,12 +207,17 @@ async function searchCelestialObjectImage(objectName: string): Promise<NasaImage
 const app = express();
 app.use(express.json());
 
-// Health check
+// Health check. Everything except the timestamp is fixed for the lifetime of
+// the process, so build that part once.
+const healthPayloadBase = {
+  status: 'ok',
+  hasDbUrl: !!process.env.DATABASE_URL
+};
+
 app.get('/api/health', (_req, res) => {
   res.json({
-    status: 'ok',
-    timestamp: new Date().toISOString(),
-    hasDbUrl: !!process.env.DATABASE_URL
+    ...healthPayloadBase,
+    timestamp: new Date().toISOString()
   });
 });
 
@@ -221,12 +226,10 @@ app.get('/api/celestial-objects', async (req, res) => {
   try {
     const { type } = req.query;
 
-    let objects = await getDb().select().from(celestialObjects);
-
-    // Filter by type if provided
-    if (type && typeof type === 'string') {
-      objects = objects.filter(obj => obj.type === type);
-    }
+    // Apply the type filter in SQL instead of fetching the whole catalog
+    const objects = type && typeof type === 'string'
+      ? await getDb().select().from(celestialObjects).where(eq(celestialObjects.type, type))
+      : await getDb().select().from(celestialObjects);
 
     res.json(objects);
   } catch (error) {
@@ -241,16 +244,19 @@ app.get('/api/celestial-objects', async (req, res) => {
 app.get('/api/observations', async (_req, res) => {
   try {
     const obs = await getDb().select().from(observations);
-    // Enhance with celestial object details
-    const enhanced = await Promise.all(
-      obs.map(async (o) => {
-        const [celestialObject] = await getDb()
-          .select()
-          .from(celestialObjects)
-          .where(eq(celestialObjects.id, o.objectId!));
-        return { ...o, celestialObject };
-      })
-    );
+
+    // Enhance with celestial object details: fetch all referenced objects in
+    // one query instead of one query per observation
+    const objectIds = Array.from(new Set(obs.map(o => o.objectId).filter((id): id is number => id !== null)));
+    const objects = objectIds.length > 0
+      ? await getDb().select().from(celestialObjects).where(inArray(celestialObjects.id, objectIds))
+      : [];
+    const objectMap = new Map(objects.map(o => [o.id, o]));
+
+    const enhanced = obs.map(o => ({
+      ...o,
+      celestialObject: o.objectId !== null ? objectMap.get(o.objectId) : undefined,
+    }));
     res.json(enhanced);
   } catch (error) {
     res.status(500).json({
@@ -287,11 +293,24 @@ async function fetchApodFromNasa(): Promise<{
   return response.json();
 }
 
-// Get APOD - always fetch fresh from NASA, use cache only as fallback
+// In-process TTL cache for APOD. Warm serverless instances serve repeat
+// requests within the window without a NASA round trip; APOD only changes
+// once a day so an hour of staleness is acceptable.
+const APOD_TTL_MS = 60 * 60 * 1000;
+let apodMemoryCache: { data: Awaited<ReturnType<typeof fetchApodFromNasa>>; expiresAt: number } | null = null;
+
+// Get APOD - fetch fresh from NASA, use caches as fallback
 app.get('/api/apod', async (_req, res) => {
   try {
-    // Always fetch today's APOD from NASA (no date param = today)
+    // Serve from the in-process cache when it is still fresh
+    if (apodMemoryCache && Date.now() < apodMemoryCache.expiresAt) {
+      res.setHeader('Cache-Control', 'public, max-age=3600');
+      return res.json(apodMemoryCache.data);
+    }
+
+    // Fetch today's APOD from NASA (no date param = today)
     const nasaData = await fetchApodFromNasa();
+    apodMemoryCache = { data: nasaData, expiresAt: Date.now() + APOD_TTL_MS };
     const apodDate = nasaData.date;
 
     // Check if we already have this date cached
@@ -316,6 +335,7 @@ app.get('/api/apod', async (_req, res) => {
     }
 
     // Return fresh data from NASA
+    res.setHeader('Cache-Control', 'public, max-age=3600');
     res.json(nasaData);
   } catch (error) {
     console.error('NASA API error, falling back to cache:', error);
@@ -354,12 +374,18 @@ app.get('/api/monthly-guide', async (req, res) => {
     const year = parseInt((req.query.year as string) || new Date().getFullYear().toString());
     const hemisphere = (req.query.hemisphere as string) || 'Northern';
 
-    const guides = await getDb().select().from(monthlyGuides);
-    const guide = guides.find(g =>
-      g.month === month &&
-      g.year === year &&
-      (g.hemisphere === hemisphere || g.hemisphere === 'both' || g.hemisphere === 'Both')
-    );
+    // Look up the guide directly instead of scanning every guide row
+    const [guide] = await getDb().select().from(monthlyGuides).where(
+      and(
+        eq(monthlyGuides.month, month),
+        eq(monthlyGuides.year, year),
+        or(
+          eq(monthlyGuides.hemisphere, hemisphere),
+          eq(monthlyGuides.hemisphere, 'Both'),
+          eq(monthlyGuides.hemisphere, 'both')
+        )
+      )
+    ).limit(1);
 
     if (!guide) {
       return res.status(404).json({ message: 'Monthly guide not found' });
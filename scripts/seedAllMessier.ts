@@ -140,10 +140,15 @@ const MESSIER_CATALOG: MessierObject[] = [
 async function seedAllMessier() {
   console.log("Seeding all 110 Messier objects with 2MASS images...\n");
 
-  let addedCount = 0;
   let skippedCount = 0;
   let updatedCount = 0;
 
+  // Load the catalog once up front instead of re-querying it per Messier object
+  const existing = await db.select().from(celestialObjects);
+
+  // Collect new rows so they can be inserted in one bulk statement
+  const newObjects: (typeof celestialObjects.$inferInsert)[] = [];
+
   for (const obj of MESSIER_CATALOG) {
     const imageFilename = MESSIER_2MASS_IMAGES[obj.messier];
     const imageUrl = imageFilename ? `${TWOMASS_BASE_URL}${imageFilename}` : null;
@@ -152,7 +157,6 @@ async function seedAllMessier() {
     const displayName = obj.name === obj.messier ? obj.messier : `${obj.name} (${obj.messier})`;
 
     // Check if object already exists (by Messier number in name)
-    const existing = await db.select().from(celestialObjects);
     const existingObj = existing.find(e =>
       e.name.includes(`(${obj.messier})`) ||
       e.name === obj.messier ||
@@ -174,8 +178,7 @@ async function seedAllMessier() {
       continue;
     }
 
-    // Insert new object
-    await db.insert(celestialObjects).values({
+    newObjects.push({
       name: displayName,
       type: obj.type,
       description: obj.description,
@@ -183,10 +186,14 @@ async function seedAllMessier() {
       constellation: obj.constellation,
       magnitude: obj.magnitude,
     });
+    console.log(`✅ Adding ${displayName}`);
+  }
 
-    console.log(`✅ Added ${displayName}`);
-    addedCount++;
+  // Insert all new objects in a single multi-row statement
+  if (newObjects.length > 0) {
+    await db.insert(celestialObjects).values(newObjects);
   }
+  const addedCount = newObjects.length;
 
   console.log("\n" + "=".repeat(50));
   console.log("\nSummary:");
@@ -1,8 +1,12 @@
 import express, { type Request, Response, NextFunction } from "express";
+import { gzipResponses } from "./lib/compression";
 import { registerRoutes } from "./routes";
 import { setupVite, serveStatic, log } from "./vite";
 
 const app = express();
+// Gzip JSON/catalog responses - descriptions compress well and this path
+// serves full payloads when run outside Vercel (which compresses at its edge)
+app.use(gzipResponses(500));
 app.use(express.json());
 app.use(express.urlencoded({ extended: false }));
 
@@ -53,8 +57,8 @@ app.get('/api/health', (_req, res) => {
     const status = err.status || err.statusCode || 500;
     const message = err.message || "Internal Server Error";
 
+    console.error('Unhandled route error:', err);
     res.status(status).json({ message });
-    throw err;
   });
 
   // importantly only setup vite in development and after
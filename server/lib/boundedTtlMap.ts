@@ -0,0 +1,39 @@
+/**
+ * Bounded TTL Map
+ *
+ * Small in-process cache shared by the service layer: a Map with a maximum
+ * entry count (oldest insertion evicted first) and an optional per-entry
+ * time-to-live. Expired entries are dropped lazily on read.
+ */
+
+export class BoundedTtlMap<K, V> {
+  private readonly entries = new Map<K, { value: V; expiresAt: number }>();
+
+  constructor(
+    private readonly maxEntries: number,
+    private readonly ttlMs: number = Infinity
+  ) {}
+
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+    if (Date.now() > entry.expiresAt) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    return entry.value;
+  }
+
+  set(key: K, value: V): void {
+    // Evict the oldest entry if the cache is full (insertion order)
+    if (this.entries.size >= this.maxEntries && !this.entries.has(key)) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest !== undefined) this.entries.delete(oldest);
+    }
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+  }
+
+  delete(key: K): void {
+    this.entries.delete(key);
+  }
+}
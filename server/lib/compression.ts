@@ -0,0 +1,40 @@
+/**
+ * Response Compression Middleware
+ *
+ * Gzips JSON/text responses using Node's built-in zlib — no extra dependency
+ * needed for the local Express server (Vercel compresses at its edge).
+ * Responses below the size threshold, to clients that don't advertise gzip,
+ * or with non-compressible content types pass through untouched.
+ */
+
+import { gzipSync } from "zlib";
+import type { NextFunction, Request, Response } from "express";
+
+// Content types worth compressing; images and other binary bodies are not
+const COMPRESSIBLE_TYPE_RE = /\b(?:json|text|javascript|xml|svg)\b/i;
+
+export function gzipResponses(threshold: number = 500) {
+  return (req: Request, res: Response, next: NextFunction) => {
+    const acceptEncoding = req.headers['accept-encoding'];
+    if (typeof acceptEncoding !== 'string' || !/\bgzip\b/.test(acceptEncoding)) {
+      return next();
+    }
+
+    const originalSend = res.send.bind(res);
+    res.send = function (body?: unknown): Response {
+      if ((typeof body === 'string' || Buffer.isBuffer(body)) && !res.getHeader('Content-Encoding')) {
+        const buffer = typeof body === 'string' ? Buffer.from(body) : body;
+        const contentType = String(res.getHeader('Content-Type') || '');
+        if (buffer.length >= threshold && COMPRESSIBLE_TYPE_RE.test(contentType)) {
+          res.setHeader('Content-Encoding', 'gzip');
+          res.setHeader('Vary', 'Accept-Encoding');
+          res.removeHeader('Content-Length');
+          return originalSend(gzipSync(buffer));
+        }
+      }
+      return originalSend(body as any);
+    };
+
+    next();
+  };
+}
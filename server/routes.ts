@@ -1,19 +1,107 @@
 import type { Express, Request, Response } from "express";
 import { z } from "zod";
+import { createHash } from "crypto";
 import { createServer, type Server } from "http";
 import { storage } from "./storage";
 import { fetchApod } from "./services/nasaApi";
-import { searchCelestialObjectImage, updateCelestialObjectImage, updateAllCelestialObjectImages } from "./services/nasaImages";
+import { searchCelestialObjectImage, updateCelestialObjectImage, updateAllCelestialObjectImages, mapWithConcurrency } from "./services/nasaImages";
 import { seedDatabase, getCurrentMonth, getCurrentYear } from "./services/celestialObjects";
 import { celestialObjectExists, cleanupDuplicateCelestialObjects } from "./services/cleanupDuplicates";
 import {
   insertObservationSchema,
   insertCelestialObjectSchema,
-  celestialObjectTypes
+  celestialObjectTypes,
+  type CelestialObject
 } from "@shared/schema";
 import { extractCelestialObjectsFromText } from "./services/objectExtractor";
 import { autoPopulatePreview } from "./services/guideAutoPopulate";
 
+// Upper bound on article bodies accepted by the admin guide import
+const MAX_ARTICLE_BYTES = 2 * 1024 * 1024;
+
+// APOD date query params must be YYYY-MM-DD; anything else gets a 400
+const APOD_DATE_RE = /^\d{4}-\d{2}-\d{2}$/;
+
+/**
+ * Read a response body as text while enforcing a byte limit. Cancels the
+ * stream and returns null as soon as the limit is exceeded, so an oversized
+ * body is never fully buffered — chunked and compressed responses carry no
+ * usable Content-Length, making a header check alone insufficient.
+ */
+async function readBodyWithLimit(response: globalThis.Response, maxBytes: number): Promise<string | null> {
+  if (!response.body) {
+    const text = await response.text();
+    return text.length > maxBytes ? null : text;
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let receivedBytes = 0;
+  let text = '';
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    receivedBytes += value.byteLength;
+    if (receivedBytes > maxBytes) {
+      await reader.cancel();
+      return null;
+    }
+    text += decoder.decode(value, { stream: true });
+  }
+  return text + decoder.decode();
+}
+
+// HTML-stripping patterns for imported guide articles, compiled once rather
+// than per request (the admin import runs them over full article bodies)
+const SCRIPT_TAG_RE = /<script[^>]*>[\s\S]*?<\/script>/gi;
+const STYLE_TAG_RE = /<style[^>]*>[\s\S]*?<\/style>/gi;
+const HTML_TAG_RE = /<[^>]+>/g;
+const WHITESPACE_RE = /\s+/g;
+
+/** Strong ETag derived from a response body's content */
+function responseEtag(body: string): string {
+  return `"${createHash('sha1').update(body).digest('hex').slice(0, 16)}"`;
+}
+
+// The object type list is constant within a build, but changes with deploys
+// when a new type is added — so its JSON and ETag are computed once here,
+// and clients revalidate rather than caching it as immutable
+const serializedObjectTypes = JSON.stringify(celestialObjectTypes);
+const objectTypesEtag = responseEtag(serializedObjectTypes);
+
+// Pre-serialized catalog response and its ETag, keyed on the identity of the
+// array that storage returns so both are rebuilt exactly once per catalog
+// cache refresh
+let serializedCatalogSource: CelestialObject[] | null = null;
+let serializedCatalog = { body: "", etag: "" };
+
+function serializeCatalog(objects: CelestialObject[]): { body: string; etag: string } {
+  if (objects !== serializedCatalogSource) {
+    const body = JSON.stringify(objects);
+    serializedCatalog = { body, etag: responseEtag(body) };
+    serializedCatalogSource = objects;
+  }
+  return serializedCatalog;
+}
+
+// Memoized type-filtered responses, keyed on the identity of the per-type
+// arrays storage hands back (same approach as serializeCatalog above). The
+// arrays are rebuilt whenever the storage cache refreshes — in-process
+// writes and TTL reloads alike — so the memo tracks the storage TTL instead
+// of outliving it; the WeakMap lets replaced arrays drop their bytes.
+const typeFilterCache = new WeakMap<CelestialObject[], { body: string; etag: string }>();
+
+async function serializeCatalogByType(type: string): Promise<{ body: string; etag: string }> {
+  const objects = await storage.getCelestialObjectsByType(type);
+  let entry = typeFilterCache.get(objects);
+  if (entry === undefined) {
+    const body = JSON.stringify(objects);
+    entry = { body, etag: responseEtag(body) };
+    typeFilterCache.set(objects, entry);
+  }
+  return entry;
+}
+
 export async function registerRoutes(app: Express, options?: { skipSeeding?: boolean }): Promise<Server | null> {
   // Skip seeding in serverless environments (run npm run db:seed separately)
   const isServerless = process.env.VERCEL === '1' || options?.skipSeeding;
@@ -33,6 +121,11 @@ export async function registerRoutes(app: Express, options?: { skipSeeding?: boo
       const { date, refresh } = req.query;
       const forceRefresh = refresh === 'true';
 
+      // Reject malformed dates up front instead of sending them to NASA
+      if (date !== undefined && (typeof date !== 'string' || !APOD_DATE_RE.test(date))) {
+        return res.status(400).json({ message: 'Invalid date format. Expected YYYY-MM-DD.' });
+      }
+
       console.log(`APOD request received - Date: ${date || 'current'}, Force refresh: ${forceRefresh}`);
 
       // Set appropriate cache headers based on whether we want fresh data
@@ -53,7 +146,15 @@ export async function registerRoutes(app: Express, options?: { skipSeeding?: boo
       const apodData = await fetchApod(date as string | undefined, forceRefresh);
       console.log(`APOD data returned: ${apodData.title} (${apodData.date})`);
 
-      res.json(apodData);
+      // ETag lets clients revalidate with a cheap 304 instead of a full body
+      const body = JSON.stringify(apodData);
+      const etag = responseEtag(body);
+      res.setHeader('ETag', etag);
+      if (!forceRefresh && req.headers['if-none-match'] === etag) {
+        return res.status(304).end();
+      }
+
+      res.type('application/json').send(body);
     } catch (error) {
       console.error('NASA APOD API error:', error);
       res.status(500).json({
@@ -67,15 +168,20 @@ export async function registerRoutes(app: Express, options?: { skipSeeding?: boo
     try {
       const { type } = req.query;
 
-      // Filter by type if provided
-      if (type) {
-        const objects = await storage.getCelestialObjectsByType(type as string);
-        return res.json(objects);
+      // Serialized once per catalog refresh, filtered by type if provided
+      const { body, etag } = type
+        ? await serializeCatalogByType(type as string)
+        : serializeCatalog(await storage.getAllCelestialObjects());
+
+      // The ETag is derived from the body content (as /api/apod does), so
+      // revalidation stays correct across restarts and writes made by other
+      // processes against the shared database
+      res.setHeader('ETag', etag);
+      if (req.headers['if-none-match'] === etag) {
+        return res.status(304).end();
       }
 
-      // Otherwise return all objects
-      const objects = await storage.getAllCelestialObjects();
-      res.json(objects);
+      res.type('application/json').send(body);
     } catch (error) {
       res.status(500).json({
         message: `Failed to get celestial objects: ${error instanceof Error ? error.message : 'Unknown error'}`
@@ -188,9 +294,14 @@ export async function registerRoutes(app: Express, options?: { skipSeeding?: boo
   });
 
   // Get celestial object types (for filtering)
-  app.get("/api/celestial-object-types", async (_req: Request, res: Response) => {
+  app.get("/api/celestial-object-types", async (req: Request, res: Response) => {
     try {
-      res.json(celestialObjectTypes);
+      res.setHeader('Cache-Control', 'public, max-age=3600');
+      res.setHeader('ETag', objectTypesEtag);
+      if (req.headers['if-none-match'] === objectTypesEtag) {
+        return res.status(304).end();
+      }
+      res.type('application/json').send(serializedObjectTypes);
     } catch (error) {
       res.status(500).json({
         message: `Failed to get celestial object types: ${error instanceof Error ? error.message : 'Unknown error'}`
@@ -241,13 +352,8 @@ export async function registerRoutes(app: Express, options?: { skipSeeding?: boo
       const year = parseInt((req.query.year as string) || getCurrentYear().toString());
       const hemisphere = (req.query.hemisphere as string) || "Northern";
 
-      // Find a matching guide
-      const guides = await storage.getAllMonthlyGuides();
-      const guide = guides.find(g =>
-        g.month === month &&
-        g.year === year &&
-        (g.hemisphere === hemisphere || g.hemisphere === "both")
-      );
+      // Single indexed lookup instead of loading and scanning every guide
+      const guide = await storage.getMonthlyGuideByMonthYear(month, year, hemisphere);
 
       if (!guide) {
         return res.status(404).json({ message: "Monthly guide not found" });
@@ -314,16 +420,16 @@ export async function registerRoutes(app: Express, options?: { skipSeeding?: boo
       const userId = 1;
       const observations = await storage.getUserObservations(userId);
 
-      // Enhance with celestial object details
-      const enhancedObservations = await Promise.all(
-        observations.map(async (obs) => {
-          const celestialObject = await storage.getCelestialObject(obs.objectId!);
-          return {
-            ...obs,
-            celestialObject
-          };
-        })
-      );
+      // Enhance with celestial object details using a single bulk fetch
+      // instead of one lookup per observation
+      const objectIds = Array.from(new Set(observations.map(obs => obs.objectId!).filter(id => id != null)));
+      const objects = await storage.getCelestialObjectsByIds(objectIds);
+      const objectMap = new Map(objects.map(o => [o.id, o]));
+
+      const enhancedObservations = observations.map(obs => ({
+        ...obs,
+        celestialObject: objectMap.get(obs.objectId!)
+      }));
 
       res.json(enhancedObservations);
     } catch (error) {
@@ -463,62 +569,83 @@ export async function registerRoutes(app: Express, options?: { skipSeeding?: boo
         });
       }
 
-      const html = await response.text();
+      // Fast path: reject declared-oversized bodies before reading a byte.
+      // Guide articles are a few hundred KB at most, so anything bigger is
+      // not a page worth parsing.
+      const contentLength = parseInt(response.headers.get('content-length') || '0');
+      if (contentLength > MAX_ARTICLE_BYTES) {
+        return res.status(400).json({
+          success: false,
+          message: `URL content too large to import (${contentLength} bytes)`,
+          objectsAdded: 0
+        });
+      }
+
+      // Chunked/compressed responses carry no usable Content-Length, so the
+      // cap is also enforced while streaming the body
+      const html = await readBodyWithLimit(response, MAX_ARTICLE_BYTES);
+      if (html === null) {
+        return res.status(400).json({
+          success: false,
+          message: `URL content too large to import (over ${MAX_ARTICLE_BYTES} bytes)`,
+          objectsAdded: 0
+        });
+      }
 
       // Extract text content (strip HTML)
       const textContent = html
-        .replace(/<script[^>]*>[\s\S]*?<\/script>/gi, '')
-        .replace(/<style[^>]*>[\s\S]*?<\/style>/gi, '')
-        .replace(/<[^>]+>/g, ' ')
-        .replace(/\s+/g, ' ')
+        .replace(SCRIPT_TAG_RE, '')
+        .replace(STYLE_TAG_RE, '')
+        .replace(HTML_TAG_RE, ' ')
+        .replace(WHITESPACE_RE, ' ')
         .trim();
 
       // Extract celestial objects from content
       const extractedObjects = extractCelestialObjectsFromText(textContent, month);
       console.log(`Extracted ${extractedObjects.length} celestial objects from article`);
 
-      // Add objects to database with NASA/Wikipedia image search
-      let objectsAdded = 0;
-      for (const obj of extractedObjects) {
+      // Add objects to database with NASA/Wikipedia image search. Searches
+      // run with bounded concurrency so a large article doesn't serialize
+      // dozens of back-to-back network round trips
+      const added = await mapWithConcurrency(extractedObjects, 4, async (obj) => {
         try {
           const existing = await storage.getCelestialObjectByName(obj.name);
-          if (!existing) {
-            // Search for image from NASA or Wikipedia
-            let imageUrl = 'https://images.unsplash.com/photo-1446776877081-d282a0f896e2?auto=format&fit=crop&w=800&h=500';
-            let imageSource = 'fallback';
-
-            try {
-              console.log(`🔍 Searching for image: ${obj.name}`);
-              const imageResult = await searchCelestialObjectImage(obj.name);
-              if (imageResult.success && imageResult.image_url) {
-                imageUrl = imageResult.image_url;
-                imageSource = imageResult.source || 'unknown';
-                console.log(`✓ Found image for ${obj.name} [${imageSource}]: ${imageUrl}`);
-              } else {
-                console.log(`⚠ No image found for ${obj.name}, using fallback`);
-              }
-            } catch (imgErr) {
-              console.log(`⚠ Image search failed for ${obj.name}: ${imgErr}`);
+          if (existing) return false;
+
+          // Search for image from NASA or Wikipedia
+          let imageUrl = 'https://images.unsplash.com/photo-1446776877081-d282a0f896e2?auto=format&fit=crop&w=800&h=500';
+          let imageSource = 'fallback';
+
+          try {
+            console.log(`🔍 Searching for image: ${obj.name}`);
+            const imageResult = await searchCelestialObjectImage(obj.name);
+            if (imageResult.success && imageResult.image_url) {
+              imageUrl = imageResult.image_url;
+              imageSource = imageResult.source || 'unknown';
+              console.log(`✓ Found image for ${obj.name} [${imageSource}]: ${imageUrl}`);
+            } else {
+              console.log(`⚠ No image found for ${obj.name}, using fallback`);
             }
-
-            await storage.createCelestialObject({
-              name: obj.name,
-              type: obj.type,
-              description: obj.description,
-              imageUrl: imageUrl,
-              constellation: obj.constellation || null,
-              magnitude: obj.magnitude || null,
-            });
-            objectsAdded++;
-            console.log(`✓ Added: ${obj.name} [image: ${imageSource}]`);
-
-            // Small delay between API calls to be respectful
-            await new Promise(resolve => setTimeout(resolve, 500));
+          } catch (imgErr) {
+            console.log(`⚠ Image search failed for ${obj.name}: ${imgErr}`);
           }
+
+          await storage.createCelestialObject({
+            name: obj.name,
+            type: obj.type,
+            description: obj.description,
+            imageUrl: imageUrl,
+            constellation: obj.constellation || null,
+            magnitude: obj.magnitude || null,
+          });
+          console.log(`✓ Added: ${obj.name} [image: ${imageSource}]`);
+          return true;
         } catch (err) {
           console.log(`Skipped ${obj.name}: ${err}`);
+          return false;
         }
-      }
+      });
+      const objectsAdded = added.filter(Boolean).length;
 
       // Create or update monthly guide
       const guides = await storage.getAllMonthlyGuides();
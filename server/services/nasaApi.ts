@@ -8,9 +8,65 @@
 import { ApodResponse, InsertApodCache, apodCache } from "@shared/schema";
 import { db } from "../db";
 import { eq, desc } from "drizzle-orm";
+import { BoundedTtlMap } from "../lib/boundedTtlMap";
 
 const NASA_API_KEY = process.env.NASA_API_KEY || 'DEMO_KEY';
 
+// Shared headers for every NASA API request. Connection reuse itself comes
+// for free: Node's fetch dispatches through one global keep-alive pool, so
+// all calls in this module share warm TLS connections to api.nasa.gov.
+const NASA_REQUEST_HEADERS = {
+  'Accept': 'application/json',
+  'User-Agent': 'StellarDiary/1.0 (+https://stellar-diary.vercel.app)'
+} as const;
+
+// In-process TTL cache for APOD responses (date -> response). Sits in front of
+// the database cache so repeat requests for the same date skip both the NASA
+// round trip and a database read. APOD content is immutable per date, so a
+// generous TTL is safe.
+const APOD_MEMORY_TTL_MS = 6 * 60 * 60 * 1000; // 6 hours
+const APOD_MEMORY_MAX_ENTRIES = 1024;
+const apodMemoryCache = new BoundedTtlMap<string, ApodResponse>(APOD_MEMORY_MAX_ENTRIES, APOD_MEMORY_TTL_MS);
+
+// Retry transient NASA API failures (rate limits and 5xx) with exponential
+// backoff; connection reuse comes from Node's built-in fetch keep-alive pool
+const APOD_RETRY_ATTEMPTS = 3;
+const APOD_RETRY_BASE_DELAY_MS = 300;
+const RETRYABLE_STATUS_CODES = new Set([429, 500, 502, 503, 504]);
+
+async function fetchWithRetry(url: string): Promise<globalThis.Response> {
+  let lastError: Error | null = null;
+
+  for (let attempt = 0; attempt < APOD_RETRY_ATTEMPTS; attempt++) {
+    if (attempt > 0) {
+      await new Promise(resolve => setTimeout(resolve, APOD_RETRY_BASE_DELAY_MS * 2 ** (attempt - 1)));
+    }
+
+    try {
+      const response = await fetch(url, { headers: NASA_REQUEST_HEADERS });
+
+      if (!RETRYABLE_STATUS_CODES.has(response.status)) {
+        return response;
+      }
+      lastError = new Error(`NASA APOD API error ${response.status}`);
+      console.warn(`NASA APOD request got ${response.status}, retrying (attempt ${attempt + 1}/${APOD_RETRY_ATTEMPTS})`);
+    } catch (error) {
+      lastError = error instanceof Error ? error : new Error(String(error));
+      console.warn(`NASA APOD request failed, retrying (attempt ${attempt + 1}/${APOD_RETRY_ATTEMPTS}):`, lastError.message);
+    }
+  }
+
+  throw lastError || new Error('NASA APOD request failed');
+}
+
+/** Today's date formatted for the APOD API (YYYY-MM-DD) */
+function todayDateString(): string {
+  const today = new Date();
+  const month = (today.getMonth() + 1).toString().padStart(2, '0');
+  const day = today.getDate().toString().padStart(2, '0');
+  return `${today.getFullYear()}-${month}-${day}`;
+}
+
 /**
  * Fetch APOD from NASA's official API using Node.js fetch
  */
@@ -21,12 +77,7 @@ async function fetchApodFromNasaApi(date?: string): Promise<ApodResponse> {
 
   const url = `${baseUrl}?${params.toString()}`;
 
-  const response = await fetch(url, {
-    headers: {
-      'Accept': 'application/json',
-      'User-Agent': 'StellarDiary/1.0 (+https://stellar-diary.vercel.app)'
-    }
-  });
+  const response = await fetchWithRetry(url);
 
   if (!response.ok) {
     const text = await response.text();
@@ -57,19 +108,13 @@ async function fetchApodFromNasaApi(date?: string): Promise<ApodResponse> {
  * @returns Promise with APOD data
  */
 export async function fetchApod(date?: string, forceRefresh = false): Promise<ApodResponse> {
-  // Get the current date
-  const today = new Date();
-  const year = today.getFullYear();
-  const month = (today.getMonth() + 1).toString().padStart(2, '0');
-  const day = today.getDate().toString().padStart(2, '0');
-
-  // Date format for API requests
-  const todayStr = `${year}-${month}-${day}`;
-  const targetDate = date || todayStr;
+  // Default to today's date (YYYY-MM-DD) when no date was requested
+  const targetDate = date || todayDateString();
 
   // Check if we should force refresh
   if (forceRefresh) {
     console.log(`Force refresh requested for APOD. Clearing cache for ${targetDate}`);
+    apodMemoryCache.delete(targetDate);
     try {
       // Delete any existing cache entry for the target date
       await db.delete(apodCache).where(eq(apodCache.date, targetDate));
@@ -81,12 +126,21 @@ export async function fetchApod(date?: string, forceRefresh = false): Promise<Ap
   }
   // Check for cached data if not forcing refresh
   else {
+    // Memory cache first - no network or database round trip on a hit
+    const memoryHit = apodMemoryCache.get(targetDate);
+    if (memoryHit) {
+      console.log(`Using in-memory APOD data for ${targetDate}`);
+      return memoryHit;
+    }
+
     try {
       const cachedData = await db.select().from(apodCache).where(eq(apodCache.date, targetDate));
 
       if (cachedData.length > 0) {
         console.log(`Using cached APOD data for ${targetDate}`);
-        return cachedData[0] as unknown as ApodResponse;
+        const cached = cachedData[0] as unknown as ApodResponse;
+        apodMemoryCache.set(targetDate, cached);
+        return cached;
       }
     } catch (err) {
       console.error('Error checking cache:', err);
@@ -100,6 +154,8 @@ export async function fetchApod(date?: string, forceRefresh = false): Promise<Ap
 
     console.log(`NASA API returned APOD data: ${data.title} (${data.date})`);
 
+    apodMemoryCache.set(data.date, data);
+
     // Save to cache
     try {
       const insertData: InsertApodCache = {
@@ -171,12 +227,7 @@ export async function fetchApodRange(startDate: string, endDate: string): Promis
   try {
     console.log(`Fetching APOD range from ${startDate} to ${endDate}...`);
 
-    const response = await fetch(url, {
-      headers: {
-        'Accept': 'application/json',
-        'User-Agent': 'StellarDiary/1.0 (+https://stellar-diary.vercel.app)'
-      }
-    });
+    const response = await fetchWithRetry(url);
 
     if (!response.ok) {
       const text = await response.text();
@@ -8,27 +8,41 @@
 import { db } from "../db";
 import { celestialObjects } from "@shared/schema";
 import { eq } from "drizzle-orm";
-import {
-  searchCelestialObjectImage as searchImage,
-  previewCelestialObjectImageSearch as previewSearch,
+import { searchCelestialObjectImage } from "./nasaImagesNode";
+
+// Search and preview come straight from nasaImagesNode; re-export them so
+// callers keep importing everything image-related from this module
+export {
+  searchCelestialObjectImage,
+  previewCelestialObjectImageSearch,
   type NasaImageSearchResult
 } from "./nasaImagesNode";
 
-// Re-export types
-export type { NasaImageSearchResult };
+// How many image searches to run at once during batch updates - enough to
+// overlap network latency without hammering the NASA/Wikipedia APIs
+const IMAGE_UPDATE_CONCURRENCY = 4;
 
 /**
- * Search for a celestial object image using NASA/Wikipedia APIs
+ * Map over items with a bounded number of concurrent workers, preserving
+ * input order in the results
  */
-export async function searchCelestialObjectImage(objectName: string): Promise<NasaImageSearchResult> {
-  return searchImage(objectName);
-}
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let nextIndex = 0;
+
+  const workers = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index]);
+    }
+  });
 
-/**
- * Preview NASA image search results without updating the database
- */
-export async function previewCelestialObjectImageSearch(objectName: string): Promise<NasaImageSearchResult> {
-  return previewSearch(objectName);
+  await Promise.all(workers);
+  return results;
 }
 
 /**
@@ -131,30 +145,20 @@ export async function updateAllCelestialObjectImages(forceUpdate: boolean = fals
 
     console.log(`Updating images for ${objectsToUpdate.length} celestial objects...`);
 
-    const results = [];
-    let successCount = 0;
-    let failureCount = 0;
-
-    // Process each object with a small delay to avoid overwhelming the API
-    for (const object of objectsToUpdate) {
+    // Process objects with bounded concurrency: a few searches overlap their
+    // network waits while keeping request pressure on the APIs modest
+    const results = await mapWithConcurrency(objectsToUpdate, IMAGE_UPDATE_CONCURRENCY, async (object) => {
       const result = await updateCelestialObjectImage(object.id);
-
-      results.push({
+      return {
         objectName: object.name,
         success: result.success,
         message: result.message,
         newImageUrl: result.newImageUrl
-      });
-
-      if (result.success) {
-        successCount++;
-      } else {
-        failureCount++;
-      }
+      };
+    });
 
-      // Small delay between requests to be respectful to NASA/Wikipedia API
-      await new Promise(resolve => setTimeout(resolve, 1000));
-    }
+    const successCount = results.filter(r => r.success).length;
+    const failureCount = results.length - successCount;
 
     return {
       success: true,
@@ -5,6 +5,8 @@
  * and Wikipedia as a fallback. Replaces the Python implementation for Vercel compatibility.
  */
 
+import { BoundedTtlMap } from "../lib/boundedTtlMap";
+
 export interface NasaImageSearchResult {
   success: boolean;
   object_name: string;
@@ -62,29 +64,153 @@ interface WikipediaApiResponse {
   };
 }
 
+// Shared headers for every outbound API request in this module. Connection
+// reuse across NASA and Wikipedia hosts is handled by Node fetch's global
+// keep-alive pool, so no per-call session setup is needed.
+const DEFAULT_HEADERS = {
+  'Accept': 'application/json',
+  'User-Agent': 'StellarDiary/1.0 (+https://stellar-diary.vercel.app)'
+} as const;
+
+// Status codes worth retrying: rate limits and transient server errors.
+// Other 4xx responses are deterministic, so retrying them just wastes the
+// caller's time and the API's rate budget.
+const RETRYABLE_STATUS_CODES = new Set([429, 500, 502, 503, 504]);
+
+// Decorrelated-jitter backoff bounds. Randomized waits keep concurrent
+// callers from retrying in lockstep against the same rate-limited API,
+// and the cap bounds worst-case stall per attempt.
+const BACKOFF_BASE_MS = 250;
+const BACKOFF_CAP_MS = 8000;
+
+// Total wall-clock budget per logical request, attempts and backoff
+// included, plus the timeout for any single attempt. Bounding the whole
+// budget (not just the attempt count) lets a stuck NASA call fail over to
+// Wikipedia in bounded time instead of tying up the caller.
+const REQUEST_DEADLINE_MS = 10 * 1000;
+const ATTEMPT_TIMEOUT_MS = 5 * 1000;
+
+/** Next backoff delay: random between base and 3x the previous delay, capped */
+function nextBackoffDelay(previousDelayMs: number): number {
+  const upper = Math.max(BACKOFF_BASE_MS, previousDelayMs * 3);
+  return Math.min(BACKOFF_CAP_MS, BACKOFF_BASE_MS + Math.random() * (upper - BACKOFF_BASE_MS));
+}
+
+// Per-host caps on concurrent outbound requests. Batch imports fan many
+// searches out at once; without a cap that turns into a burst of parallel
+// sockets against the same API and invites 429s. Wikipedia is a courtesy
+// fallback, so it gets a smaller allowance.
+const NASA_MAX_CONCURRENT = 8;
+const WIKIPEDIA_MAX_CONCURRENT = 4;
+
+/** Minimal counting semaphore for bounding concurrent async work */
+class Semaphore {
+  private available: number;
+  private waiters: Array<() => void> = [];
+
+  constructor(count: number) {
+    this.available = count;
+  }
+
+  async acquire(): Promise<void> {
+    if (this.available > 0) {
+      this.available--;
+      return;
+    }
+    await new Promise<void>(resolve => this.waiters.push(resolve));
+  }
+
+  release(): void {
+    const next = this.waiters.shift();
+    if (next) {
+      next();
+    } else {
+      this.available++;
+    }
+  }
+}
+
+const nasaSemaphore = new Semaphore(NASA_MAX_CONCURRENT);
+const wikipediaSemaphore = new Semaphore(WIKIPEDIA_MAX_CONCURRENT);
+
+function semaphoreForUrl(url: string): Semaphore {
+  return url.includes('wikipedia.org') ? wikipediaSemaphore : nasaSemaphore;
+}
+
+// Identical requests issued while an earlier one is still in flight are
+// folded into the pending promise instead of opening a second round trip —
+// e.g. two concurrent searches for the same object, or batch candidates
+// sharing one nasa_id. Entries are removed as soon as the request settles.
+const inflightRequests = new Map<string, Promise<unknown>>();
+
 /**
- * Make API request with retry logic and error handling
+ * Make API request with retry logic and error handling.
+ *
+ * Retries network failures and transient HTTP errors with jittered
+ * backoff, honoring a Retry-After header when the server sends one.
+ * Non-retryable client errors (e.g. 404) fail immediately. Concurrent
+ * calls for the same URL share a single in-flight request.
  */
-async function makeApiRequest<T>(url: string, maxRetries: number = 3): Promise<T | null> {
+function makeApiRequest<T>(url: string, maxRetries: number = 3): Promise<T | null> {
+  const existing = inflightRequests.get(url);
+  if (existing) {
+    return existing as Promise<T | null>;
+  }
+
+  const request = performApiRequest<T>(url, maxRetries).finally(() => {
+    inflightRequests.delete(url);
+  });
+  inflightRequests.set(url, request);
+  return request;
+}
+
+async function performApiRequest<T>(url: string, maxRetries: number): Promise<T | null> {
+  const semaphore = semaphoreForUrl(url);
+  const deadline = Date.now() + REQUEST_DEADLINE_MS;
+  let backoffMs = BACKOFF_BASE_MS;
   for (let attempt = 0; attempt < maxRetries; attempt++) {
+    let retryAfterMs: number | null = null;
+    // Hold a host slot only for the network call itself, not for backoff
+    // sleeps, so waiting callers can use it in the meantime
+    await semaphore.acquire();
     try {
+      const remainingMs = deadline - Date.now();
+      if (remainingMs <= 0) {
+        console.error(`Request deadline exceeded after ${attempt} attempt(s) for ${url}`);
+        return null;
+      }
+
       const response = await fetch(url, {
-        headers: {
-          'Accept': 'application/json',
-          'User-Agent': 'StellarDiary/1.0 (+https://stellar-diary.vercel.app)'
-        }
+        headers: DEFAULT_HEADERS,
+        signal: AbortSignal.timeout(Math.min(ATTEMPT_TIMEOUT_MS, remainingMs))
       });
 
       if (!response.ok) {
+        if (!RETRYABLE_STATUS_CODES.has(response.status)) {
+          console.error(`Request failed (not retryable): HTTP ${response.status} for ${url}`);
+          return null;
+        }
+        const retryAfter = response.headers.get('retry-after');
+        if (retryAfter && /^\d+$/.test(retryAfter)) {
+          retryAfterMs = parseInt(retryAfter) * 1000;
+        }
         throw new Error(`HTTP ${response.status}: ${response.statusText}`);
       }
 
       return await response.json() as T;
     } catch (error) {
-      console.error(`Attempt ${attempt + 1} failed:`, error);
-      if (attempt < maxRetries - 1) {
-        // Exponential backoff
-        await new Promise(resolve => setTimeout(resolve, Math.pow(2, attempt) * 1000));
+      console.warn(`Attempt ${attempt + 1} failed:`, error);
+    } finally {
+      semaphore.release();
+    }
+
+    if (attempt < maxRetries - 1) {
+      // Jittered backoff, or the server's own Retry-After if longer,
+      // but never sleep past the deadline
+      backoffMs = nextBackoffDelay(backoffMs);
+      const sleepMs = Math.min(Math.max(backoffMs, retryAfterMs ?? 0), deadline - Date.now());
+      if (sleepMs > 0) {
+        await new Promise(resolve => setTimeout(resolve, sleepMs));
       }
     }
   }
@@ -107,57 +233,107 @@ async function searchNasaImagesData(query: string, size: number = 3): Promise<Na
   return makeApiRequest<NasaApiResponse>(url);
 }
 
+// Asset manifests are immutable for a given nasa_id, so cache them for the
+// process lifetime (no TTL); repeat searches for popular objects skip the
+// second round trip to the asset endpoint. Bounded so long-running processes
+// don't accumulate manifests without limit.
+const ASSET_MANIFEST_MAX_ENTRIES = 512;
+const assetManifestCache = new BoundedTtlMap<string, NasaAssetResponse>(ASSET_MANIFEST_MAX_ENTRIES);
+
+// Accepted image extensions and the variant-name tokens that mark a
+// high-resolution asset in NASA manifests
+const IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png'] as const;
+const SIZE_TOKENS = ['large', '1024', '2048'] as const;
+
+async function fetchAssetManifest(nasaId: string): Promise<NasaAssetResponse | null> {
+  const cached = assetManifestCache.get(nasaId);
+  if (cached) {
+    return cached;
+  }
+
+  const assetUrl = `https://images-api.nasa.gov/asset/${nasaId}`;
+  const manifest = await makeApiRequest<NasaAssetResponse>(assetUrl);
+
+  if (manifest) {
+    assetManifestCache.set(nasaId, manifest);
+  }
+  return manifest;
+}
+
+// How many top-ranked search results to fetch asset manifests for
+const MANIFEST_CANDIDATE_COUNT = 3;
+
 /**
- * Extract the best image URL from NASA API response
+ * Pick the best image href from a list of asset manifest items.
+ *
+ * Prefers high-resolution images. Lowercase each href once and check
+ * extensions and size tokens against it; break on the first large variant
+ * since nothing later in the manifest would beat it.
  */
-async function extractBestImageUrl(apiResponse: NasaApiResponse): Promise<string | null> {
+function pickBestHref(assetItems: Array<{ href: string }>): string | null {
+  let bestUrl: string | null = null;
+  for (const item of assetItems) {
+    const href = item.href;
+    const hrefLower = href.toLowerCase();
+    if (IMAGE_EXTENSIONS.some(ext => hrefLower.endsWith(ext))) {
+      if (SIZE_TOKENS.some(token => hrefLower.includes(token))) {
+        bestUrl = href;
+        break;
+      } else if (!bestUrl) {
+        bestUrl = href;
+      }
+    }
+  }
+  return bestUrl;
+}
+
+/**
+ * Extract the best image URL from NASA API response.
+ *
+ * When a high-resolution image is wanted, asset manifests for the
+ * top-ranked candidates are fetched concurrently (the search already
+ * returns several results), then examined in ranking order — one fan-out
+ * of parallel requests instead of sequential trips. When preferHires is
+ * false, the preview link embedded in the search response is used
+ * directly, skipping the manifest round trip entirely.
+ */
+async function extractBestImageUrl(apiResponse: NasaApiResponse, preferHires: boolean = true): Promise<string | null> {
   try {
     const items = apiResponse.collection?.items;
     if (!items || items.length === 0) {
       return null;
     }
 
-    const firstItem = items[0];
-    const nasaId = firstItem.data?.[0]?.nasa_id;
-
-    if (!nasaId) {
-      // Fallback to preview link if available
-      const previewLink = firstItem.links?.find(link => link.rel === 'preview');
-      return previewLink?.href || null;
-    }
-
-    // Fetch asset manifest to get image URLs
-    const assetUrl = `https://images-api.nasa.gov/asset/${nasaId}`;
-    const assetResponse = await makeApiRequest<NasaAssetResponse>(assetUrl);
-
-    if (!assetResponse) {
-      // Fallback to preview link
-      const previewLink = firstItem.links?.find(link => link.rel === 'preview');
-      return previewLink?.href || null;
+    // Preview-quality requests are served straight from the search
+    // response's embedded links — no second HTTP call needed
+    if (!preferHires) {
+      const previewLink = items[0].links?.find(link => link.rel === 'preview' || link.render === 'image');
+      if (previewLink?.href) {
+        return previewLink.href.replace(/^http:\/\//, 'https://');
+      }
     }
 
-    const assetItems = assetResponse.collection?.items || [];
-
-    // Prefer high-resolution images
-    let bestUrl: string | null = null;
-    for (const item of assetItems) {
-      const href = item.href;
-      if (href.endsWith('.jpg') || href.endsWith('.jpeg') || href.endsWith('.png')) {
-        // Prefer larger images
-        if (href.toLowerCase().includes('large') || href.includes('1024') || href.includes('2048')) {
-          bestUrl = href;
-          break;
-        } else if (!bestUrl) {
-          bestUrl = href;
-        }
+    // Fetch manifests for the top candidates in parallel
+    const candidates = items.slice(0, MANIFEST_CANDIDATE_COUNT);
+    const manifests = await Promise.all(candidates.map(item => {
+      const nasaId = item.data?.[0]?.nasa_id;
+      return nasaId ? fetchAssetManifest(nasaId) : Promise.resolve(null);
+    }));
+
+    // Keep the original search ranking: the first candidate whose manifest
+    // yields a usable image wins
+    for (const manifest of manifests) {
+      if (!manifest) continue;
+      const bestUrl = pickBestHref(manifest.collection?.items || []);
+      if (bestUrl) {
+        // Ensure HTTPS to avoid mixed content warnings
+        return bestUrl.replace(/^http:\/\//, 'https://');
       }
     }
 
-    // Ensure HTTPS to avoid mixed content warnings
-    if (bestUrl) {
-      bestUrl = bestUrl.replace(/^http:\/\//, 'https://');
-    }
-    return bestUrl;
+    // Fallback to the top result's preview link if available
+    const previewLink = items[0].links?.find(link => link.rel === 'preview');
+    return previewLink?.href || null;
   } catch (error) {
     console.error('Error extracting image URL:', error);
     return null;
@@ -236,6 +412,41 @@ const MESSIER_COMMON_NAMES: Record<string, string> = {
   'M104': 'Sombrero Galaxy',
 };
 
+// Reverse lookup: lowercased common name -> canonical Messier designation,
+// built once from the table above
+const COMMON_NAME_TO_MESSIER: Record<string, string> = Object.fromEntries(
+  Object.entries(MESSIER_COMMON_NAMES).map(([designation, common]) => [common.toLowerCase(), designation])
+);
+
+const WHITESPACE_RE = /\s+/g;
+const MESSIER_NAME_RE = /^m\s*(\d+)$/i;
+const CATALOG_NAME_RE = /^(ngc|ic)\s*(\d+)$/i;
+
+/**
+ * Normalize an object name to its canonical form so that "m57", "M 57" and
+ * "Ring Nebula" all resolve to the same queries and cache entries.
+ */
+function normalizeObjectName(name: string): string {
+  const collapsed = name.trim().replace(WHITESPACE_RE, ' ');
+
+  const alias = COMMON_NAME_TO_MESSIER[collapsed.toLowerCase()];
+  if (alias) {
+    return alias;
+  }
+
+  const messierMatch = collapsed.match(MESSIER_NAME_RE);
+  if (messierMatch) {
+    return `M${messierMatch[1]}`;
+  }
+
+  const catalogMatch = collapsed.match(CATALOG_NAME_RE);
+  if (catalogMatch) {
+    return `${catalogMatch[1].toUpperCase()} ${catalogMatch[2]}`;
+  }
+
+  return collapsed;
+}
+
 /**
  * Expand short catalog names to full names for better search results.
  * E.g., "M42" -> ["Orion Nebula", "Messier 42"], "NGC 7000" -> ["NGC 7000 nebula"]
@@ -273,27 +484,70 @@ function expandObjectName(name: string): string[] {
   return queries;
 }
 
+// Memoized final search results keyed by lowercased object name. Popular
+// objects (M57, Andromeda, ...) repeat across imports and admin actions;
+// a hit skips the NASA and Wikipedia round trips entirely. Only successful
+// results are cached — failures may be transient. A durable on-disk cache
+// doesn't fit the serverless deployment, where the filesystem is ephemeral.
+const SEARCH_RESULT_TTL_MS = 24 * 60 * 60 * 1000; // 24 hours
+const SEARCH_RESULT_MAX_ENTRIES = 512;
+const searchResultCache = new BoundedTtlMap<string, NasaImageSearchResult>(SEARCH_RESULT_MAX_ENTRIES, SEARCH_RESULT_TTL_MS);
+
 /**
- * Search for a celestial object image - tries NASA first, then Wikipedia
+ * Try the expanded queries against Wikipedia in order, returning the first hit
  */
-export async function searchCelestialObjectImage(objectName: string): Promise<NasaImageSearchResult> {
+async function searchWikipediaWithQueries(queries: string[]): Promise<{ success: boolean; image_url: string | null; title: string } | null> {
+  for (const query of queries) {
+    const wikiResult = await searchWikipediaImage(query);
+    if (wikiResult.success && wikiResult.image_url) {
+      return wikiResult;
+    }
+  }
+  return null;
+}
+
+/**
+ * Search for a celestial object image - tries NASA first, then Wikipedia.
+ *
+ * The Wikipedia lookup is started speculatively alongside the NASA search:
+ * NASA and Wikipedia are independent services, so on the (common for obscure
+ * objects) fallback path the answer is already in flight instead of only
+ * starting after NASA has fully failed. A NASA hit still wins.
+ */
+export async function searchCelestialObjectImage(objectName: string, preferHires: boolean = true): Promise<NasaImageSearchResult> {
+  // Canonicalize the name so spelling variants ("m 57", "Ring Nebula")
+  // share queries and cache entries. Preview and high-res results differ,
+  // so they cache under separate keys.
+  const normalizedName = normalizeObjectName(objectName);
+  const cacheKey = normalizedName.toLowerCase() + (preferHires ? '' : ':preview');
+  const cached = searchResultCache.get(cacheKey);
+  if (cached) {
+    console.log(`Using cached image search result for: ${objectName}`);
+    // Report the caller's own spelling, not the one that seeded the cache
+    return { ...cached, object_name: objectName };
+  }
+
   try {
     console.log(`Searching for image (NASA/Wikipedia) for: ${objectName}`);
 
-    const searchQueries = expandObjectName(objectName);
+    const searchQueries = expandObjectName(normalizedName);
+
+    // Kick off the Wikipedia fallback now; it resolves (never rejects) in the
+    // background and is only awaited if NASA comes up empty
+    const wikipediaPromise = searchWikipediaWithQueries(searchQueries);
 
     // Try NASA with expanded queries
     for (const query of searchQueries) {
       const searchResult = await searchNasaImagesData(query, 3);
 
       if (searchResult) {
-        const imageUrl = await extractBestImageUrl(searchResult);
+        const imageUrl = await extractBestImageUrl(searchResult, preferHires);
 
         if (imageUrl) {
           const items = searchResult.collection?.items || [];
           const data = items[0]?.data?.[0];
 
-          return {
+          const result: NasaImageSearchResult = {
             success: true,
             object_name: objectName,
             image_url: imageUrl,
@@ -306,30 +560,32 @@ export async function searchCelestialObjectImage(objectName: string): Promise<Na
               nasa_id: data?.nasa_id || ''
             }
           };
+          searchResultCache.set(cacheKey, result);
+          return result;
         }
       }
     }
 
-    // Fallback to Wikipedia with expanded queries
+    // Fallback to Wikipedia (already searching since before the NASA loop)
     console.log(`NASA search failed for ${objectName}, trying Wikipedia...`);
-    for (const query of searchQueries) {
-      const wikiResult = await searchWikipediaImage(query);
-
-      if (wikiResult.success && wikiResult.image_url) {
-        return {
-          success: true,
-          object_name: objectName,
-          image_url: wikiResult.image_url,
-          source: 'wikipedia',
-          metadata: {
-            title: wikiResult.title,
-            description: '',
-            date_created: '',
-            center: '',
-            nasa_id: ''
-          }
-        };
-      }
+    const wikiResult = await wikipediaPromise;
+
+    if (wikiResult) {
+      const result: NasaImageSearchResult = {
+        success: true,
+        object_name: objectName,
+        image_url: wikiResult.image_url,
+        source: 'wikipedia',
+        metadata: {
+          title: wikiResult.title,
+          description: '',
+          date_created: '',
+          center: '',
+          nasa_id: ''
+        }
+      };
+      searchResultCache.set(cacheKey, result);
+      return result;
     }
 
     // All queries failed
@@ -351,8 +607,11 @@ export async function searchCelestialObjectImage(objectName: string): Promise<Na
 }
 
 /**
- * Preview NASA image search results without updating the database
+ * Preview NASA image search results without updating the database.
+ *
+ * Accepts the preview-quality image embedded in the search response, so
+ * the common case costs one NASA round trip instead of two.
  */
 export async function previewCelestialObjectImageSearch(objectName: string): Promise<NasaImageSearchResult> {
-  return searchCelestialObjectImage(objectName);
+  return searchCelestialObjectImage(objectName, false);
 }
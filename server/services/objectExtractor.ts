@@ -64,12 +64,25 @@ const namedObjects: Record<string, { type: string; description: string; constell
   'Sombrero Galaxy': { type: 'galaxy', description: 'The Sombrero Galaxy (M104) - galaxy with bright nucleus.', constellation: 'Virgo' },
 };
 
+// Catalog designation patterns, compiled once at module load. The planet and
+// named-object patterns used to be rebuilt with new RegExp per extraction
+// call; each entry's pattern is constant, so build them all up front.
+const messierPattern = /\b(M|Messier\s*)(\d{1,3})\b/gi;
+const ngcPattern = /\bNGC\s*(\d{1,4})\b/gi;
+const icPattern = /\bIC\s*(\d{1,4})\b/gi;
+
+const planetPatterns: Array<[string, RegExp]> = Object.keys(planetData)
+  .map(planet => [planet, new RegExp(`\\b${planet}\\b`, 'i')]);
+
+const namedObjectPatterns: Array<[string, RegExp]> = Object.keys(namedObjects)
+  .map(name => [name, new RegExp(name, 'i')]);
+
 export function extractCelestialObjectsFromText(text: string, month: string): ExtractedObject[] {
   const objects: ExtractedObject[] = [];
   const foundNames = new Set<string>();
 
   // Messier objects (M1, M31, etc.)
-  const messierPattern = /\b(M|Messier\s*)(\d{1,3})\b/gi;
+  messierPattern.lastIndex = 0;
   let match;
   while ((match = messierPattern.exec(text)) !== null) {
     const num = parseInt(match[2]);
@@ -95,7 +108,7 @@ export function extractCelestialObjectsFromText(text: string, month: string): Ex
   }
 
   // NGC objects
-  const ngcPattern = /\bNGC\s*(\d{1,4})\b/gi;
+  ngcPattern.lastIndex = 0;
   while ((match = ngcPattern.exec(text)) !== null) {
     const name = `NGC ${match[1]}`;
     if (!foundNames.has(name)) {
@@ -109,7 +122,7 @@ export function extractCelestialObjectsFromText(text: string, month: string): Ex
   }
 
   // IC objects
-  const icPattern = /\bIC\s*(\d{1,4})\b/gi;
+  icPattern.lastIndex = 0;
   while ((match = icPattern.exec(text)) !== null) {
     const name = `IC ${match[1]}`;
     if (!foundNames.has(name)) {
@@ -123,9 +136,9 @@ export function extractCelestialObjectsFromText(text: string, month: string): Ex
   }
 
   // Planets
-  for (const [planet, data] of Object.entries(planetData)) {
-    const planetPattern = new RegExp(`\\b${planet}\\b`, 'gi');
+  for (const [planet, planetPattern] of planetPatterns) {
     if (planetPattern.test(text) && !foundNames.has(planet)) {
+      const data = planetData[planet];
       foundNames.add(planet);
       objects.push({
         name: planet,
@@ -137,11 +150,10 @@ export function extractCelestialObjectsFromText(text: string, month: string): Ex
   }
 
   // Named deep sky objects
-  for (const [name, info] of Object.entries(namedObjects)) {
-    const pattern = new RegExp(name, 'gi');
+  for (const [name, pattern] of namedObjectPatterns) {
     if (pattern.test(text) && !foundNames.has(name)) {
       foundNames.add(name);
-      objects.push({ name, ...info });
+      objects.push({ name, ...namedObjects[name] });
     }
   }
 
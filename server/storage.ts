@@ -25,6 +25,7 @@ export interface IStorage {
   getCelestialObjectsByType(type: string): Promise<CelestialObject[]>;
   getCelestialObjectsByIds(ids: number[]): Promise<CelestialObject[]>;
   createCelestialObject(object: InsertCelestialObject): Promise<CelestialObject>;
+  createCelestialObjects(objects: InsertCelestialObject[]): Promise<CelestialObject[]>;
   updateCelestialObject(id: number, object: Partial<CelestialObject>): Promise<CelestialObject | undefined>;
   deleteCelestialObject(id: number): Promise<boolean>;
   
@@ -55,9 +56,37 @@ export interface IStorage {
   getAllTelescopeTips(): Promise<TelescopeTip[]>;
   getTelescopeTipsByCategory(category: string): Promise<TelescopeTip[]>;
   createTelescopeTip(tip: InsertTelescopeTip): Promise<TelescopeTip>;
+  createTelescopeTips(tips: InsertTelescopeTip[]): Promise<TelescopeTip[]>;
 }
 
 export class DatabaseStorage implements IStorage {
+  // In-memory cache of the celestial object catalog. The catalog is small and
+  // very read-heavy, so list reads are served from memory. The cache is
+  // invalidated on any write and expires after a short TTL to bound staleness
+  // when another process writes to the same database.
+  private static readonly CATALOG_CACHE_TTL_MS = 60 * 1000;
+  private catalogCache: CelestialObject[] | null = null;
+  private catalogCachedAt = 0;
+  // Secondary index over the cached catalog, built lazily per refresh
+  private catalogByType: Map<string, CelestialObject[]> | null = null;
+
+  private invalidateCatalogCache(): void {
+    this.catalogCache = null;
+    this.catalogByType = null;
+  }
+
+  // Telescope tips change only through the rare create path, so reads are
+  // served from the same style of TTL-bounded in-memory cache as the catalog
+  private tipsCache: TelescopeTip[] | null = null;
+  private tipsCachedAt = 0;
+  // Secondary index over the cached tips, built lazily per refresh
+  private tipsByCategory: Map<string, TelescopeTip[]> | null = null;
+
+  private invalidateTipsCache(): void {
+    this.tipsCache = null;
+    this.tipsByCategory = null;
+  }
+
   async getUser(id: number): Promise<User | undefined> {
     const [user] = await db.select().from(users).where(eq(users.id, id));
     return user || undefined;
@@ -87,11 +116,31 @@ export class DatabaseStorage implements IStorage {
   }
 
   async getAllCelestialObjects(): Promise<CelestialObject[]> {
-    return await db.select().from(celestialObjects);
+    const now = Date.now();
+    if (this.catalogCache && now - this.catalogCachedAt < DatabaseStorage.CATALOG_CACHE_TTL_MS) {
+      return this.catalogCache;
+    }
+    this.catalogCache = await db.select().from(celestialObjects);
+    this.catalogCachedAt = now;
+    this.catalogByType = null;
+    return this.catalogCache;
   }
 
   async getCelestialObjectsByType(type: string): Promise<CelestialObject[]> {
-    return await db.select().from(celestialObjects).where(eq(celestialObjects.type, type));
+    const catalog = await this.getAllCelestialObjects();
+    if (!this.catalogByType) {
+      const byType = new Map<string, CelestialObject[]>();
+      for (const object of catalog) {
+        const group = byType.get(object.type);
+        if (group) {
+          group.push(object);
+        } else {
+          byType.set(object.type, [object]);
+        }
+      }
+      this.catalogByType = byType;
+    }
+    return this.catalogByType.get(type) || [];
   }
 
   async getCelestialObjectsByIds(ids: number[]): Promise<CelestialObject[]> {
@@ -104,15 +153,28 @@ export class DatabaseStorage implements IStorage {
       .insert(celestialObjects)
       .values(insertObject)
       .returning();
+    this.invalidateCatalogCache();
     return object;
   }
 
+  async createCelestialObjects(insertObjects: InsertCelestialObject[]): Promise<CelestialObject[]> {
+    if (insertObjects.length === 0) return [];
+    // Single multi-row insert - one round trip instead of one per object
+    const objects = await db
+      .insert(celestialObjects)
+      .values(insertObjects)
+      .returning();
+    this.invalidateCatalogCache();
+    return objects;
+  }
+
   async updateCelestialObject(id: number, update: Partial<CelestialObject>): Promise<CelestialObject | undefined> {
     const [updatedObject] = await db
       .update(celestialObjects)
       .set(update)
       .where(eq(celestialObjects.id, id))
       .returning();
+    this.invalidateCatalogCache();
     return updatedObject || undefined;
   }
 
@@ -121,6 +183,7 @@ export class DatabaseStorage implements IStorage {
       .delete(celestialObjects)
       .where(eq(celestialObjects.id, id))
       .returning();
+    this.invalidateCatalogCache();
     return !!deleted;
   }
 
@@ -170,7 +233,8 @@ export class DatabaseStorage implements IStorage {
         eq(monthlyGuides.year, year),
         or(
           eq(monthlyGuides.hemisphere, hemisphere),
-          eq(monthlyGuides.hemisphere, 'Both')
+          eq(monthlyGuides.hemisphere, 'Both'),
+          eq(monthlyGuides.hemisphere, 'both')
         )
       )
     );
@@ -178,8 +242,11 @@ export class DatabaseStorage implements IStorage {
   }
 
   async getCurrentMonthlyGuide(hemisphere: string): Promise<MonthlyGuide | undefined> {
-    const currentMonth = new Date().toLocaleString('default', { month: 'long' });
-    const currentYear = new Date().getFullYear();
+    // One clock read for both components, so month and year can't straddle a
+    // year boundary between two separate Date constructions
+    const now = new Date();
+    const currentMonth = now.toLocaleString('default', { month: 'long' });
+    const currentYear = now.getFullYear();
     return this.getMonthlyGuideByMonthYear(currentMonth, currentYear, hemisphere);
   }
 
@@ -253,11 +320,31 @@ export class DatabaseStorage implements IStorage {
   }
 
   async getAllTelescopeTips(): Promise<TelescopeTip[]> {
-    return await db.select().from(telescopeTips);
+    const now = Date.now();
+    if (this.tipsCache && now - this.tipsCachedAt < DatabaseStorage.CATALOG_CACHE_TTL_MS) {
+      return this.tipsCache;
+    }
+    this.tipsCache = await db.select().from(telescopeTips);
+    this.tipsCachedAt = now;
+    this.tipsByCategory = null;
+    return this.tipsCache;
   }
 
   async getTelescopeTipsByCategory(category: string): Promise<TelescopeTip[]> {
-    return await db.select().from(telescopeTips).where(eq(telescopeTips.category, category));
+    const tips = await this.getAllTelescopeTips();
+    if (!this.tipsByCategory) {
+      const byCategory = new Map<string, TelescopeTip[]>();
+      for (const tip of tips) {
+        const group = byCategory.get(tip.category);
+        if (group) {
+          group.push(tip);
+        } else {
+          byCategory.set(tip.category, [tip]);
+        }
+      }
+      this.tipsByCategory = byCategory;
+    }
+    return this.tipsByCategory.get(category) || [];
   }
 
   async createTelescopeTip(insertTip: InsertTelescopeTip): Promise<TelescopeTip> {
@@ -265,8 +352,19 @@ export class DatabaseStorage implements IStorage {
       .insert(telescopeTips)
       .values(insertTip)
       .returning();
+    this.invalidateTipsCache();
     return tip;
   }
+
+  async createTelescopeTips(insertTips: InsertTelescopeTip[]): Promise<TelescopeTip[]> {
+    if (insertTips.length === 0) return [];
+    const tips = await db
+      .insert(telescopeTips)
+      .values(insertTips)
+      .returning();
+    this.invalidateTipsCache();
+    return tips;
+  }
 }
 
 // Use DatabaseStorage instead of MemStorage for persistent storage
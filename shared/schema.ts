@@ -1,4 +1,4 @@
-import { pgTable, text, serial, integer, boolean, date, timestamp } from "drizzle-orm/pg-core";
+import { pgTable, text, serial, integer, boolean, date, timestamp, index } from "drizzle-orm/pg-core";
 import { createInsertSchema } from "drizzle-zod";
 import { z } from "zod";
 
@@ -42,7 +42,10 @@ export const observations = pgTable("observations", {
   observationNotes: text("observation_notes"),
   dateAdded: timestamp("date_added").defaultNow(),
   plannedDate: date("planned_date"),
-});
+}, (table) => ({
+  // Observations are always fetched per user, so index the lookup column
+  userIdIdx: index("observations_user_id_idx").on(table.userId),
+}));
 
 // Create a modified schema with better validation
 export const insertObservationSchema = createInsertSchema(observations)
@@ -69,7 +72,10 @@ export const monthlyGuides = pgTable("monthly_guides", {
   videoUrls: text("video_urls").array(), // Array of YouTube video URLs
   sources: text("sources").array(), // URLs of source articles (High Point Scientific, Sky & Telescope)
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => ({
+  // Guides are looked up by month/year (plus hemisphere) on every guide read
+  monthYearIdx: index("monthly_guides_month_year_idx").on(table.month, table.year, table.hemisphere),
+}));
 
 export const insertMonthlyGuideSchema = createInsertSchema(monthlyGuides).omit({
   id: true,